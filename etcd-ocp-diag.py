@@ -0,0 +1,949 @@
+#!/usr/bin/env python3
+
+import gzip
+import mmap
+import os
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from datetime import datetime
+from pathlib import Path
+from statistics import median
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from isal import igzip
+except ImportError:
+    igzip = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Compiled once; these run per line (or per file) in the hot paths.
+_ROTATED_DATE_RE = re.compile(r"\d{8}-\d{6}")
+_ROTATED_LOG_RE = re.compile(r"[0-9]\.log\.")
+
+@dataclass(frozen=True)
+class SearchConfig:
+    """Search options shared by every report, built once per command."""
+
+    mg_path: str = "."
+    pod_log_version: str = "current"
+    rotated_logs: bool = False
+    err_date: str = ""
+    err_date_search: bool = False
+    compare_times: bool = False
+    pod_known: bool = False
+    pod: str = ""
+
+# Known etcd pod errors
+etcd_error_list = [
+    "waiting for ReadIndex response took too long, retrying",
+    "etcdserver: request timed out",
+    "slow fdatasync",
+    "apply request took too long",
+    "leader failed to send out heartbeat on time; took too long, leader is overloaded likely from slow disk",
+    "local node might have slow network",
+    "elected leader",
+    "lost leader",
+    "wal: sync duration",
+    "the clock difference against peer",
+    "lease not found",
+    "rafthttp: failed to read",
+    "server is likely overloaded",
+    "lost the tcp streaming",
+    "sending buffer is full",
+    "health errors",
+    "timed out waiting for read index response",
+]
+
+# Byte needles for searching mmap'd logs without decoding them.
+ETCD_ERROR_BYTES = [(err, err.encode()) for err in etcd_error_list]
+
+# Single-pass multi-pattern automaton over the error list. Falls back to a
+# bytes.count() pass per pattern when pyahocorasick is not installed.
+if ahocorasick is not None:
+    _ERROR_AUTOMATON = ahocorasick.Automaton()
+    for _idx, _err in enumerate(etcd_error_list):
+        _ERROR_AUTOMATON.add_word(_err, (_idx, _err))
+    _ERROR_AUTOMATON.make_automaton()
+else:
+    _ERROR_AUTOMATON = None
+
+
+def signal_handler(sig, frame):
+    print()
+    sys.exit(0)
+
+
+def validate_date(date_str):
+    """Return True if date_str is a valid YYYY-MM-DD date."""
+    try:
+        datetime.strptime(date_str, "%Y-%m-%d")
+        return True
+    except ValueError:
+        return False
+
+
+def _etcd_pod_dirs(pods_path):
+    """Yield the etcd pod directories under a namespaces/openshift-etcd/pods path."""
+    try:
+        entries = os.scandir(pods_path)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if (
+                entry.is_dir(follow_symlinks=False)
+                and name.startswith("etcd-")
+                and not name.startswith("etcd-guard")
+                and not name.startswith("etcd-quorum-guard")
+            ):
+                yield entry.path
+
+
+def get_dirs(mg_path):
+    """Return the etcd pod directories found in the must-gather."""
+    directories = []
+    stack = [mg_path]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.name == "namespaces":
+                    pods_path = os.path.join(entry.path, "openshift-etcd", "pods")
+                    directories.extend(_etcd_pod_dirs(pods_path))
+                else:
+                    stack.append(entry.path)
+    return directories
+
+
+def get_etcd_pod(directory_path):
+    """Return the pod name for an etcd pod directory."""
+    return str(directory_path).rsplit("/", 1)[-1]
+
+
+def extract_datetime(file_path):
+    """Sort key for rotated logs based on the timestamp in the file name.
+
+    The YYYYMMDD-HHMMSS stamp has a fixed shape, so slicing it into an
+    int tuple sorts identically to datetime.strptime at a fraction of
+    the cost."""
+    match = _ROTATED_DATE_RE.search(str(file_path))
+    if not match:
+        return (0, 0, 0, 0, 0, 0)
+    stamp = match.group()
+    return (
+        int(stamp[0:4]),
+        int(stamp[4:6]),
+        int(stamp[6:8]),
+        int(stamp[9:11]),
+        int(stamp[11:13]),
+        int(stamp[13:15]),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_rotated_logs(dir_path):
+    """Return the rotated logs for an etcd pod directory, oldest first.
+
+    Cached because --stats lists the same directories once per error
+    string."""
+    rotated_list = []
+    try:
+        entries = os.scandir(f"{dir_path}/etcd/etcd/logs/rotated")
+    except OSError:
+        return rotated_list
+    with entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False) and _ROTATED_LOG_RE.search(entry.name):
+                # Decorate with the timestamp once instead of re-matching
+                # the full path in the sort key.
+                rotated_list.append((extract_datetime(entry.name), entry.path))
+    rotated_list.sort()
+    return [path for _, path in rotated_list]
+
+
+def _between(text, prefix, suffix):
+    """Slice the text between prefix and the next suffix, or None."""
+    start = text.find(prefix)
+    if start == -1:
+        return None
+    start += len(prefix)
+    end = text.find(suffix, start)
+    if end == -1:
+        return None
+    return text[start:end]
+
+
+def _extract_ts(line):
+    """Slice the fixed-width YYYY-MM-DDTHH:MM:SS timestamp out of a log line."""
+    i = line.find('"ts":"')
+    if i == -1:
+        return None
+    return line[i + 6 : i + 25]
+
+
+def _count_occurrences(mm, needle):
+    """Count occurrences of a byte needle in an mmap'd log."""
+    count = 0
+    pos = mm.find(needle)
+    while pos != -1:
+        count += 1
+        pos = mm.find(needle, pos + len(needle))
+    return count
+
+
+def _advise_sequential(fd):
+    """Hint the kernel that fd will be read front to back."""
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError):
+        pass
+
+
+def _advise_done(fd):
+    """Drop fd's pages from the page cache once a log has been scanned,
+    so scanning many rotated logs does not evict everything else."""
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except (AttributeError, OSError):
+        pass
+
+
+def _prefetch_logs(paths):
+    """Queue readahead for a pod's logs up front so the kernel fetches
+    later files while the first one is being parsed."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+@contextmanager
+def _open_log(path):
+    """Yield a searchable byte buffer for a log: gzipped rotated logs
+    are decompressed (via isal when installed), everything else is
+    mmap'd with sequential-access hints."""
+    if str(path).endswith(".gz"):
+        gzip_open = gzip.open if igzip is None else igzip.open
+        with gzip_open(path, "rb") as file:
+            yield file.read()
+        return
+    with open(path, "rb") as file:
+        _advise_sequential(file.fileno())
+        try:
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+        except ValueError:
+            # Empty logs cannot be mapped and have nothing to scan.
+            yield b""
+            return
+        try:
+            yield mm
+        finally:
+            mm.close()
+            _advise_done(file.fileno())
+
+
+def _scan_file_for_patterns(path, etcd_count, etcd_pod):
+    """Count every known etcd error in a log from an mmap of the file."""
+    file_counts = Counter()
+    with _open_log(path) as mm:
+        if _ERROR_AUTOMATON is not None:
+            # Feed the automaton 1 MiB at a time instead of line by
+            # line; chunks are cut at the last newline so a match
+            # never straddles two scans.
+            size = len(mm)
+            offset = 0
+            carry = ""
+            while offset < size:
+                buf = carry + mm[offset : offset + (1 << 20)].decode(
+                    "utf-8", "replace"
+                )
+                offset += 1 << 20
+                if offset < size:
+                    cut = buf.rfind("\n") + 1
+                    carry = buf[cut:]
+                    buf = buf[:cut]
+                # Counter.update consumes the hit stream in one
+                # C-level pass instead of a dict store per hit.
+                file_counts.update(
+                    error_text for _, (_idx, error_text) in _ERROR_AUTOMATON.iter(buf)
+                )
+        else:
+            for error_text, error_bytes in ETCD_ERROR_BYTES:
+                count = _count_occurrences(mm, error_bytes)
+                if count:
+                    file_counts[error_text] += count
+    for error_text, count in file_counts.items():
+        etcd_count[(etcd_pod, error_text)] += count
+
+
+def _search_dirs(directories, config):
+    """Sort pod directories and apply the --pod filter."""
+    sorted_dirs = sorted(directories, key=get_etcd_pod)
+    if config.pod_known:
+        sorted_dirs = [d for d in sorted_dirs if get_etcd_pod(d) == config.pod]
+    return sorted_dirs
+
+
+def _map_directories(worker, directories):
+    """Run worker over pod directories, one process per pod when there
+    are several; each pod's logs are independent."""
+    if len(directories) > 1:
+        max_workers = min(len(directories), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(worker, directories)
+    else:
+        for directory in directories:
+            yield worker(directory)
+
+
+def _iter_log_paths(directory_path, rotated, log_version):
+    """Yield every log file to scan for one pod directory."""
+    if rotated:
+        yield from get_rotated_logs(directory_path)
+    pod_log_path = directory_path / "etcd" / "etcd" / "logs" / f"{log_version}.log"
+    if pod_log_path.exists():
+        yield pod_log_path
+
+
+def _etcd_errors_worker(directory, rotated, log_version):
+    """Count the known etcd errors in one pod's logs."""
+    directory_path = Path(directory)
+    etcd_pod = get_etcd_pod(directory_path)
+    etcd_count = Counter()
+
+    logs = list(_iter_log_paths(directory_path, rotated, log_version))
+    _prefetch_logs(logs)
+    for log in logs:
+        _scan_file_for_patterns(log, etcd_count, etcd_pod)
+    return etcd_count
+
+
+def etcd_errors(directories, config):
+    """Count the known etcd errors in each pod's logs."""
+    etcd_count = Counter()
+    worker = partial(
+        _etcd_errors_worker,
+        rotated=config.rotated_logs,
+        log_version=config.pod_log_version,
+    )
+    for result in _map_directories(worker, _search_dirs(directories, config)):
+        etcd_count.update(result)
+
+    etcd_output = []
+    for (etcd_pod, error_text), count in etcd_count.items():
+        etcd_output.append(
+            {
+                "NAMESPACE": "openshift-etcd",
+                "POD": etcd_pod,
+                "ERROR": error_text,
+                "COUNT": count,
+            }
+        )
+
+    if etcd_output:
+        print_rows(etcd_output)
+    else:
+        print("No errors found.")
+
+
+def _convert_took_to_ms(took_time):
+    """Convert an etcd 'took' duration string to milliseconds."""
+    # endswith checks the tail directly instead of scanning the whole
+    # string the way "ms" in took_time does.
+    if took_time.endswith("ms"):
+        return float(took_time[:-2])
+    if took_time.endswith("s"):
+        minutes, sep, seconds = took_time.partition("m")
+        if sep:
+            return float(minutes) * 60000 + float(seconds[:-1]) * 1000
+        return float(took_time[:-1]) * 1000
+    return None
+
+
+def _convert_took_values(took_values):
+    """Convert a batch of 'took' duration strings to milliseconds."""
+    if np is None or not took_values:
+        converted = (_convert_took_to_ms(took) for took in took_values)
+        return [took_ms for took_ms in converted if took_ms is not None]
+
+    arr = np.asarray(took_values)
+    values = np.zeros(arr.shape, dtype=np.float64)
+    ms_mask = np.char.endswith(arr, "ms")
+    s_mask = np.char.endswith(arr, "s") & ~ms_mask
+    m_mask = s_mask & (np.char.find(arr, "m") >= 0)
+    s_only = s_mask & ~m_mask
+    if ms_mask.any():
+        values[ms_mask] = np.char.rstrip(arr[ms_mask], "ms").astype(np.float64)
+    if s_only.any():
+        values[s_only] = np.char.rstrip(arr[s_only], "s").astype(np.float64) * 1000
+    if m_mask.any():
+        parts = np.char.partition(arr[m_mask], "m")
+        seconds = np.char.rstrip(parts[:, 2], "s")
+        seconds = np.where(seconds == "", "0", seconds)
+        values[m_mask] = parts[:, 0].astype(np.float64) * 60000 + seconds.astype(np.float64) * 1000
+    return values[ms_mask | s_mask].tolist()
+
+
+def _iter_needle_lines(path, needle):
+    """Yield the decoded line around each needle hit in a log."""
+    with _open_log(path) as mm:
+        pos = mm.find(needle)
+        while pos != -1:
+            start = mm.rfind(b"\n", 0, pos) + 1
+            end = mm.find(b"\n", pos)
+            if end == -1:
+                end = len(mm)
+            yield mm[start:end].decode("utf-8", "replace")
+            pos = mm.find(needle, end)
+
+
+def _scan_dates(path, line_re, needle, json_dates):
+    """Bucket needle hits in one log by calendar date."""
+    for line in _iter_needle_lines(path, needle):
+        match = line_re.search(line)
+        if match is not None:
+            json_dates[match.group(1)] += 1
+
+
+def _scan_times(path, line_re, needle, date, compare_tooks, json_dates, max_times):
+    """Bucket needle hits on one date by hour:minute, tracking the
+    slowest 'took' per minute when --compare is set."""
+    for line in _iter_needle_lines(path, needle):
+        match = line_re.search(line)
+        if match is None or match.group(1) != date:
+            continue
+        time_key = match.group(2)
+        json_dates[time_key] += 1
+        if compare_tooks:
+            took_time = _between(line, '"took":"', '"')
+            if took_time:
+                took_ms = _convert_took_to_ms(took_time)
+                if took_ms is not None and took_ms > max_times.get(time_key, -1.0):
+                    max_times[time_key] = took_ms
+
+
+def _msg_count_worker(directory, error_txt, rotated, log_version, date_search, date, compare_tooks):
+    """Count error_txt occurrences in one pod's logs."""
+    directory_path = Path(directory)
+    etcd_pod = get_etcd_pod(directory_path)
+    errors = []
+    max_times = {}
+    json_dates = Counter()
+    needle = error_txt.encode()
+
+    # One pass per line: the timestamp and the error marker are pulled out
+    # by a single compiled search (re2's DFA engine when installed).
+    engine = re2 if re2 is not None else re
+    line_re = engine.compile(
+        r'"ts":"(\d{4}-\d{2}-\d{2})T(\d{2}:\d{2}).*?' + re.escape(error_txt)
+    )
+
+    # Bind the right scan loop once instead of re-testing the date flag
+    # for every matching line.
+    if date_search:
+        scan = partial(
+            _scan_times,
+            line_re=line_re,
+            needle=needle,
+            date=date,
+            compare_tooks=compare_tooks,
+            json_dates=json_dates,
+            max_times=max_times,
+        )
+    else:
+        scan = partial(_scan_dates, line_re=line_re, needle=needle, json_dates=json_dates)
+
+    logs = list(_iter_log_paths(directory_path, rotated, log_version))
+    _prefetch_logs(logs)
+    for log in logs:
+        scan(log)
+
+    # Emit once per pod so a date spanning a rotated log and current.log
+    # shows a single merged count instead of one row per file.
+    label = "TIME" if date_search else "DATE"
+    for date_key, count in sorted(json_dates.items()):
+        errors.append({"POD": etcd_pod, label: date_key, "COUNT": count})
+
+    return errors, max_times
+
+
+def msg_count(directories, error_txt, config):
+    """Print a table of error_txt occurrences per pod by day (or by
+    hour:minute when --date is set)."""
+    errors = []
+    max_times = {}
+    worker = partial(
+        _msg_count_worker,
+        error_txt=error_txt,
+        rotated=config.rotated_logs,
+        log_version=config.pod_log_version,
+        date_search=config.err_date_search,
+        date=config.err_date,
+        compare_tooks=config.compare_times,
+    )
+    for pod_errors, pod_max_times in _map_directories(worker, _search_dirs(directories, config)):
+        errors.extend(pod_errors)
+        for time_key, took_ms in pod_max_times.items():
+            if took_ms > max_times.get(time_key, -1.0):
+                max_times[time_key] = took_ms
+
+    if errors:
+        print_rows(errors)
+        if config.compare_times and max_times:
+            compare(max_times)
+    else:
+        print(f"No results found for: {error_txt}")
+
+
+def compare(max_times):
+    """Print the slowest 'took' time per minute collected by msg_count."""
+    rows = []
+    for time_key, took_ms in sorted(max_times.items()):
+        rows.append({"TIME": time_key, "MAX": f"{took_ms:.4f}ms"})
+    print_rows(rows)
+
+
+def _etcd_stats_worker(directory, error_txt, rotated, log_version):
+    """Collect timing stats about error_txt for one pod's logs."""
+    directory_path = Path(directory)
+    etcd_pod = get_etcd_pod(directory_path)
+    results = []
+
+    logs = list(_iter_log_paths(directory_path, rotated, log_version))
+    _prefetch_logs(logs)
+    for log in logs:
+        stats = calc_etcd_stats(log, error_txt, etcd_pod)
+        if stats is not None:
+            results.append(stats)
+
+    return results
+
+
+def etcd_stats(directories, error_txt, config):
+    """Print timing stats about error_txt for each pod's logs."""
+    worker = partial(
+        _etcd_stats_worker,
+        error_txt=error_txt,
+        rotated=config.rotated_logs,
+        log_version=config.pod_log_version,
+    )
+    for results in _map_directories(worker, _search_dirs(directories, config)):
+        for stats in results:
+            print_stats(*stats)
+
+
+def calc_etcd_stats(log_path, error_txt, etcd_pod):
+    """Collect the 'took' durations for error_txt in a log.
+
+    Returns the print_stats arguments, or None if nothing matched."""
+    took_values = []
+    first_err = None
+    last_line = None
+    expected = None
+    needle = error_txt.encode()
+
+    # Jump between matches with find (C code) instead of iterating
+    # every line in the interpreter; only matching lines are decoded.
+    with _open_log(log_path) as mm:
+        pos = mm.find(needle)
+        while pos != -1:
+            start = mm.rfind(b"\n", 0, pos) + 1
+            end = mm.find(b"\n", pos)
+            if end == -1:
+                end = len(mm)
+            line = mm[start:end].decode("utf-8", "replace")
+            if first_err is None:
+                first_err = _extract_ts(line)
+            last_line = line
+            took_time = _between(line, '"took":"', '"')
+            if took_time:
+                took_values.append(took_time)
+            if expected is None:
+                expected = _between(line, '"expected-duration":"', '"')
+            pos = mm.find(needle, end)
+
+    last_err = _extract_ts(last_line) if last_line is not None else None
+    etcd_error_stats = _convert_took_values(took_values)
+
+    if not etcd_error_stats:
+        return None
+    return etcd_pod, error_txt, first_err, last_err, etcd_error_stats, expected
+
+
+def print_stats(etcd_pod, error_txt, first_err, last_err, etcd_error_stats, expected):
+    """Print the stats collected by calc_etcd_stats."""
+    if np is not None:
+        values = np.asarray(etcd_error_stats, dtype=np.float64)
+        maximum = float(values.max())
+        minimum = float(values.min())
+        median_val = float(np.median(values))
+        average = float(values.mean())
+    else:
+        maximum = max(etcd_error_stats)
+        minimum = min(etcd_error_stats)
+        median_val = median(etcd_error_stats)
+        average = sum(etcd_error_stats) / len(etcd_error_stats)
+
+    # One write per block instead of a print call per line.
+    block = (
+        f"Stats about etcd '{error_txt}' messages: {etcd_pod}\n"
+        f"\tFirst Occurrence: {first_err or 'Unknown'}\n"
+        f"\tLast Occurrence: {last_err or 'Unknown'}\n"
+        f"\tMaximum: {maximum:.4f}ms\n"
+        f"\tMinimum: {minimum:.4f}ms\n"
+        f"\tMedian: {median_val:.4f}ms\n"
+        f"\tAverage: {average:.4f}ms\n"
+        f"\tCount: {len(etcd_error_stats)}\n"
+    )
+    if expected is not None:
+        block += f"\tExpected: {expected}\n"
+    sys.stdout.write(block + "\n")
+
+
+def print_rows(errors_list):
+    """Print a list of row dicts as an aligned table."""
+    keys = list(errors_list[0])
+    max_widths = {
+        key: max(len(key), max(len(str(row[key])) for row in errors_list))
+        for key in keys
+    }
+    # One write instead of a print call per cell.
+    lines = ["\t".join(f"{key:<{max_widths[key]}}" for key in keys) + "\t"]
+    lines.extend(
+        "\t".join(f"{str(row[key]):<{max_widths[key]}}" for key in keys) + "\t"
+        for row in errors_list
+    )
+    lines.append("\n")
+    sys.stdout.write("\n".join(lines))
+
+
+def clear_screen():
+    # Imported here so the non-interactive path never pays for it.
+    import subprocess
+
+    subprocess.run("clear" if os.name == "posix" else "cls", shell=True)
+
+
+# Listing cache for the navigation screen, keyed by path and
+# invalidated when the directory's mtime changes.
+_dir_cache = {}
+
+
+def list_directories(path):
+    """Return the sorted, non-hidden subdirectories of path."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return []
+    cached = _dir_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        with os.scandir(path) as entries:
+            # DirEntry.is_dir reuses the type readdir already returned,
+            # so no extra stat per entry. Filter before sorting so only
+            # the surviving names get compared.
+            directories = [
+                entry.name
+                for entry in entries
+                if entry.name[0] != "." and entry.is_dir(follow_symlinks=False)
+            ]
+    except OSError:
+        return []
+    directories.sort()
+    _dir_cache[path] = (mtime, directories)
+    return directories
+
+
+# Interactive command words, hoisted so each keystroke does one
+# lower() and set membership test instead of chained comparisons.
+_EXIT_COMMANDS = frozenset(("exit", "quit"))
+_RUN_COMMANDS = frozenset(("run commands", "commands"))
+_BACK_COMMANDS = frozenset(("back", "navigate", "directories", "dirs", "nav"))
+
+# Static screen text, built once instead of per redraw.
+_NAV_HEADER = (
+    "=== etcd-ocp-diag Folder Navigation ===\n"
+    "Navigate to your must-gather directory, then switch to command mode.\n"
+)
+_NAV_FOOTER = "\nOptions: [number], 'ls', 'pwd', '..', 'run commands', 'help', 'exit'\n"
+_CMD_BANNER = "=== etcd-ocp-diag Command Mode ==="
+
+
+def print_navigation_help():
+    print()
+    print("Navigation commands:")
+    print("  [number]        Enter the numbered directory")
+    print("  ls              Refresh the directory listing")
+    print("  pwd             Print the current directory")
+    print("  ..              Go up one directory")
+    print("  run commands    Run diag commands against the current directory")
+    print("  help            Show this help message")
+    print("  exit            Quit")
+
+
+def show_navigation_screen(current_path, previous_path=None):
+    """Render the folder navigation screen and return the numbered options."""
+    clear_screen()
+    # Store the joined paths so selecting an entry needs no further
+    # stat or path construction. Every option is just a target path
+    # now, so a flat list replaces the old (type, value) tuples.
+    display_options = [
+        os.path.join(current_path, dir_name)
+        for dir_name in list_directories(current_path)
+    ]
+
+    # Build the whole screen and write it once instead of a print per
+    # line, which matters on slow remote terminals.
+    parts = [
+        _NAV_HEADER,
+        f"\nCurrent directory: {current_path}\n\n",
+    ]
+    parts.extend(
+        f"  {i:2d}. {os.path.basename(option_path)}\n"
+        for i, option_path in enumerate(display_options, 1)
+    )
+    if previous_path:
+        display_options.append(previous_path)
+        parts.append(
+            f"  {len(display_options):2d}. [Return to {os.path.basename(previous_path)}]\n"
+        )
+    parts.append(_NAV_FOOTER)
+    # One write and one flush per redraw; print() would flush per line
+    # on a tty, which is slow over remote shells.
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
+    return display_options
+
+
+def folder_navigation_mode(current_path=None, previous_path=None):
+    """Interactive directory browser used to locate a must-gather."""
+    try:
+        # Line editing and history for the prompts; absent on Windows.
+        import readline  # noqa: F401
+    except ImportError:
+        pass
+    if current_path is None:
+        current_path = os.getcwd()
+
+    display_options = show_navigation_screen(current_path, previous_path)
+
+    while True:
+        user_input = input(f"\n[{current_path}]> ").strip()
+
+        if not user_input:
+            continue
+        command = user_input.lower()
+        if command in _EXIT_COMMANDS:
+            sys.exit(0)
+        if command == "help":
+            print_navigation_help()
+            continue
+        if command == "pwd":
+            print(current_path)
+            continue
+        if command == "ls":
+            display_options = show_navigation_screen(current_path, previous_path)
+            continue
+        if user_input == "..":
+            current_path = os.path.dirname(current_path) or current_path
+            display_options = show_navigation_screen(current_path, previous_path)
+            continue
+        if command in _RUN_COMMANDS:
+            command_mode(current_path)
+            display_options = show_navigation_screen(current_path, previous_path)
+            continue
+
+        # The common case is a mistyped command, not a number; isdigit
+        # avoids raising and catching a ValueError for it.
+        if not user_input.isdigit():
+            print("Unrecognized command. Type 'help' for the list of commands.")
+            continue
+        choice = int(user_input)
+
+        if 1 <= choice <= len(display_options):
+            # The listing already verified these are directories.
+            current_path = display_options[choice - 1]
+            display_options = show_navigation_screen(current_path, previous_path)
+        else:
+            print("Invalid selection.")
+
+
+def parse_interactive_input(user_input, mg_dir):
+    """Parse a command-mode line into an argparse namespace."""
+    parser = build_parser()
+    try:
+        import shlex
+
+        converted_args = shlex.split(user_input)
+    except ValueError as exc:
+        print(f"Could not parse command: {exc}")
+        return None
+    if "--path" not in converted_args:
+        converted_args += ["--path", mg_dir]
+    try:
+        return parser.parse_args(converted_args)
+    except SystemExit:
+        return None
+
+
+def command_mode(mg_dir):
+    """Interactive loop running diag options against mg_dir."""
+    clear_screen()
+    print(_CMD_BANNER)
+    print(f"Must-gather: {mg_dir}")
+    print("Enter option flags (e.g. '--errors', '--ttl --date 2023-08-30').")
+    print("Type 'back' to return to navigation, 'help' for options, 'exit' to quit.")
+
+    while True:
+        user_input = input("\ncommand> ").strip()
+
+        if not user_input:
+            continue
+        command = user_input.lower()
+        if command in _EXIT_COMMANDS:
+            sys.exit(0)
+        if command in _BACK_COMMANDS:
+            return
+        if command == "help":
+            build_parser().print_help()
+            continue
+
+        args = parse_interactive_input(user_input, mg_dir)
+        if args is not None:
+            print()
+            execute_command(args)
+            # No clear or banner redraw here: the last result stays on
+            # screen, and the prompt alone marks the next turn.
+
+
+@lru_cache(maxsize=None)
+def build_parser():
+    """Build the option parser once; interactive mode reparses every
+    command line with the same parser."""
+    # Deferred: argparse pulls in a dozen modules and interactive
+    # sessions only need it once a command is actually typed.
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Searches an OpenShift must-gather for known etcd errors "
+        "and provides reporting to pinpoint when slowness is occurring."
+    )
+    parser.add_argument("--path", default=".", help="Path to the must-gather folder")
+    parser.add_argument("--errors", action="store_true", help="Display known errors in the etcd logs along with their count")
+    parser.add_argument("--stats", action="store_true", help="Display Avg, Max, Min, and Median times for etcd errors")
+    parser.add_argument("--ttl", action="store_true", help="Display 'took too long' errors")
+    parser.add_argument("--heartbeat", action="store_true", help="Display 'failed to send out heartbeat on time' errors")
+    parser.add_argument("--election", action="store_true", help="Display 'elected leader' errors")
+    parser.add_argument("--lost_leader", action="store_true", help="Display 'lost leader' errors")
+    parser.add_argument("--fdatasync", action="store_true", help="Display 'slow fdatasync' errors")
+    parser.add_argument("--buffer", action="store_true", help="Display 'sending buffer is full' errors")
+    parser.add_argument("--overloaded", action="store_true", help="Display 'server is likely overloaded' errors")
+    parser.add_argument("--etcd_timeout", action="store_true", help="Display 'etcdserver: request timed out' errors")
+    parser.add_argument("--compare", action="store_true", help="With --ttl and --date, also display the slowest 'took' time per minute")
+    parser.add_argument("--previous", action="store_true", help="Use the 'previous' log instead of the 'current' log")
+    parser.add_argument("--rotated", action="store_true", help="Include rotated logs in the search")
+    parser.add_argument("--pod", help="Only search the specified etcd pod")
+    parser.add_argument("--date", help="Only search the specified date (YYYY-MM-DD)")
+    parser.add_argument("-i", "--interactive", action="store_true", help="Start in interactive folder navigation mode")
+    return parser
+
+
+def execute_command(args):
+    """Build the search config from the parsed options and run the
+    requested reports."""
+    if args.date and not validate_date(args.date):
+        print(f"Invalid date: {args.date}. Expected format: YYYY-MM-DD.")
+        return
+
+    config = SearchConfig(
+        mg_path=args.path,
+        pod_log_version="previous" if args.previous else "current",
+        rotated_logs=args.rotated,
+        err_date=args.date or "",
+        err_date_search=bool(args.date),
+        compare_times=args.compare,
+        pod_known=args.pod is not None,
+        pod=args.pod or "",
+    )
+
+    directories = get_dirs(config.mg_path)
+    if not directories:
+        print("openshift-etcd pod logs not found.")
+        print(f"Please run {os.path.basename(sys.argv[0])} against a must-gather folder.")
+        return
+
+    if args.errors:
+        etcd_errors(directories, config)
+    if args.stats:
+        for value in ["apply request took too long", "slow fdatasync"]:
+            etcd_stats(directories, value, config)
+    if args.ttl:
+        msg_count(directories, "apply request took too long", config)
+    if args.heartbeat:
+        msg_count(directories, "failed to send out heartbeat on time", config)
+    if args.election:
+        msg_count(directories, "elected leader", config)
+    if args.lost_leader:
+        msg_count(directories, "lost leader", config)
+    if args.fdatasync:
+        msg_count(directories, "slow fdatasync", config)
+    if args.buffer:
+        msg_count(directories, "sending buffer is full", config)
+    if args.overloaded:
+        msg_count(directories, "server is likely overloaded", config)
+    if args.etcd_timeout:
+        msg_count(directories, "etcdserver: request timed out", config)
+
+
+def main():
+    import signal
+
+    signal.signal(signal.SIGINT, signal_handler)
+
+    if len(sys.argv) == 1 or sys.argv[1] in ("-i", "--interactive"):
+        folder_navigation_mode()
+        return
+
+    parser = build_parser()
+    args = parser.parse_args()
+    execute_command(args)
+
+
+if __name__ == "__main__":
+    main()